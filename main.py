@@ -1,12 +1,56 @@
+import argparse
+import datetime
+import os
 import google.generativeai as genai
 from src.phrase_generator import get_inspirational_phrase
 from src.email_sender import send_email
+from src.profiler import StageProfiler
 from config import settings # Import the settings module
 
-def main():
+def default_profile_report_path():
+    """
+    Returns a timestamped report path in the project directory, next to the run log
+    (e.g. cron.log) when the script is scheduled as described in the README.
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(project_dir, f"profile_{timestamp}.txt")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Email a daily inspirational phrase.")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REPORT_PATH",
+        help=(
+            "Profile the phrase-generation and send stages with cProfile and tracemalloc "
+            "and write a report to REPORT_PATH (default: profile_<timestamp>.txt in the project directory)."
+        ),
+    )
+    return parser.parse_args(argv)
+
+def main(profile_report_path=None):
     """
     Main function to get an inspirational phrase and email it.
     Uses configuration from config.settings.
+
+    Args:
+        profile_report_path (str, optional): If set, the phrase-generation and send
+            stages are profiled and a report is written to this path.
+    """
+    profiler = StageProfiler(enabled=profile_report_path is not None)
+    try:
+        _run(profiler)
+    finally:
+        if profiler.enabled and profiler.write_report(profile_report_path):
+            print(f"Profile report written to {profile_report_path}")
+
+def _run(profiler):
+    """
+    Validates configuration, then fetches a phrase and emails it,
+    running each stage under the given StageProfiler.
     """
     # 1. Use configuration from config.settings
     # These are already loaded from .env (if present) and environment variables by settings.py
@@ -49,21 +93,23 @@ def main():
 
     # 4. Get inspirational phrase
     print("Fetching inspirational phrase...")
-    phrase_details = get_inspirational_phrase()
+    with profiler.stage("phrase_generation"):
+        phrase_details = get_inspirational_phrase()
 
     if phrase_details:
         print(f"Successfully fetched phrase: \"{phrase_details['phrase']}\" by {phrase_details['author']}")
         
         # 5. Send email
         print(f"Sending email to {settings.RECIPIENT_EMAIL}...")
-        email_sent = send_email(
-            phrase_details=phrase_details,
-            recipient_email=settings.RECIPIENT_EMAIL,
-            sender_email=settings.SENDER_EMAIL,
-            sender_password=settings.SENDER_PASSWORD,
-            smtp_server=settings.SMTP_SERVER,
-            smtp_port=settings.SMTP_PORT # This is now guaranteed to be an int if we passed the checks
-        )
+        with profiler.stage("send_email"):
+            email_sent = send_email(
+                phrase_details=phrase_details,
+                recipient_email=settings.RECIPIENT_EMAIL,
+                sender_email=settings.SENDER_EMAIL,
+                sender_password=settings.SENDER_PASSWORD,
+                smtp_server=settings.SMTP_SERVER,
+                smtp_port=settings.SMTP_PORT # This is now guaranteed to be an int if we passed the checks
+            )
 
         if email_sent:
             print("Email sent successfully!")
@@ -73,4 +119,8 @@ def main():
         print("Failed to retrieve inspirational phrase.")
 
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    report_path = args.profile
+    if report_path == "":
+        report_path = default_profile_report_path()
+    main(profile_report_path=report_path)
@@ -0,0 +1,124 @@
+import cProfile
+import contextlib
+import datetime
+import io
+import pstats
+import tracemalloc
+
+
+class StageProfiler:
+    """
+    Collects CPU and memory profiles for named stages of a run.
+
+    When disabled, stage() returns a no-op context manager so the wrapped code
+    runs without any profiling hooks installed.
+    """
+
+    def __init__(self, enabled=False, top_n=15, traceback_frames=10):
+        """
+        Args:
+            enabled (bool): Whether stages should actually be profiled.
+            top_n (int): Number of CPU hotspots and allocation sites to report per stage.
+            traceback_frames (int): Number of frames tracemalloc stores per allocation.
+        """
+        self.enabled = enabled
+        self.top_n = top_n
+        self.traceback_frames = traceback_frames
+        self.results = []
+
+    def stage(self, name):
+        """
+        Returns a context manager that profiles the enclosed block as stage `name`.
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._profile_stage(name)
+
+    @contextlib.contextmanager
+    def _profile_stage(self, name):
+        profile = cProfile.Profile()
+        # tracemalloc.stop() clears previous traces, so each stage starts fresh
+        # and get_traced_memory() reports the peak for this stage only.
+        tracemalloc.start(self.traceback_frames)
+        start_time = datetime.datetime.now()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = (datetime.datetime.now() - start_time).total_seconds()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.results.append({
+                'name': name,
+                'elapsed': elapsed,
+                'current_memory': current,
+                'peak_memory': peak,
+                'cpu_hotspots': self._format_cpu_hotspots(profile),
+                'allocation_sites': self._format_allocation_sites(snapshot),
+            })
+
+    def _format_cpu_hotspots(self, profile):
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        return stream.getvalue().strip()
+
+    def _format_allocation_sites(self, snapshot):
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        lines = []
+        for stat in snapshot.statistics('lineno')[:self.top_n]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"{frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+        return "\n".join(lines) if lines else "(no allocations traced)"
+
+    def format_report(self):
+        """
+        Builds a plain-text report of all profiled stages.
+
+        Returns:
+            str: The report contents.
+        """
+        lines = [f"Profile report ({datetime.datetime.now().isoformat(timespec='seconds')})"]
+        if not self.results:
+            lines.append("")
+            lines.append("No stages were profiled.")
+        for result in self.results:
+            lines.append("")
+            lines.append(f"=== Stage: {result['name']} ===")
+            lines.append(f"Wall time: {result['elapsed']:.3f} s")
+            lines.append(f"Peak traced memory: {result['peak_memory'] / 1024:.1f} KiB")
+            lines.append(f"Memory still allocated at stage end: {result['current_memory'] / 1024:.1f} KiB")
+            lines.append("")
+            lines.append(f"--- Top {self.top_n} allocation sites ---")
+            lines.append(result['allocation_sites'])
+            lines.append("")
+            lines.append(f"--- Top {self.top_n} CPU hotspots (by cumulative time) ---")
+            lines.append(result['cpu_hotspots'])
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, report_path):
+        """
+        Writes the report for all profiled stages to `report_path`.
+
+        Args:
+            report_path (str): Path of the report file to write.
+
+        Returns:
+            bool: True if the report was written, False otherwise.
+        """
+        try:
+            with open(report_path, 'w', encoding='utf-8') as report_file:
+                report_file.write(self.format_report())
+            return True
+        except OSError as e:
+            print(f"Error: Could not write profile report to {report_path}: {e}")
+            return False
@@ -0,0 +1,76 @@
+import unittest
+import contextlib
+import os
+import tempfile
+import tracemalloc
+
+from src.profiler import StageProfiler
+
+class TestStageProfiler(unittest.TestCase):
+
+    def test_disabled_stage_is_noop(self):
+        profiler = StageProfiler(enabled=False)
+
+        stage = profiler.stage("phrase_generation")
+        self.assertIsInstance(stage, contextlib.nullcontext)
+        with stage:
+            self.assertFalse(tracemalloc.is_tracing())
+
+        self.assertEqual(profiler.results, [])
+
+    def test_enabled_stage_records_results(self):
+        profiler = StageProfiler(enabled=True)
+
+        with profiler.stage("phrase_generation"):
+            self.assertTrue(tracemalloc.is_tracing())
+            data = [str(i) * 10 for i in range(1000)]
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(len(profiler.results), 1)
+        result = profiler.results[0]
+        self.assertEqual(result['name'], "phrase_generation")
+        self.assertGreater(result['peak_memory'], 0)
+        self.assertIn("test_profiler.py", result['allocation_sites'])
+        self.assertIn("function calls", result['cpu_hotspots'])
+        del data
+
+    def test_stage_records_results_when_block_raises(self):
+        profiler = StageProfiler(enabled=True)
+
+        with self.assertRaises(ValueError):
+            with profiler.stage("send_email"):
+                raise ValueError("boom")
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(profiler.results[0]['name'], "send_email")
+
+    def test_write_report(self):
+        profiler = StageProfiler(enabled=True)
+        with profiler.stage("phrase_generation"):
+            pass
+        with profiler.stage("send_email"):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_path = os.path.join(tmp_dir, "profile.txt")
+            self.assertTrue(profiler.write_report(report_path))
+            with open(report_path, encoding='utf-8') as report_file:
+                report = report_file.read()
+
+        self.assertIn("=== Stage: phrase_generation ===", report)
+        self.assertIn("=== Stage: send_email ===", report)
+        self.assertIn("Peak traced memory:", report)
+        self.assertIn("CPU hotspots", report)
+        self.assertIn("allocation sites", report)
+
+    def test_write_report_failure_returns_false(self):
+        profiler = StageProfiler(enabled=True)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            missing_dir_path = os.path.join(tmp_dir, "missing", "profile.txt")
+            self.assertFalse(profiler.write_report(missing_dir_path))
+
+        self.assertIn("No stages were profiled.", profiler.format_report())
+
+if __name__ == '__main__':
+    unittest.main()